@@ -0,0 +1,36 @@
+import pandas as pd
+import numpy as np
+import re
+from functools import lru_cache
+
+# Numeric prefix of a Debut Arc label, e.g. the 1 in '01. Romance Dawn'
+_ARC_RE = re.compile(r'(\d+)\.')
+
+@lru_cache(maxsize=None)
+def _parse_arc_number(arc_string: str) -> int:
+    """Numeric prefix of an arc label, or 0 without one; each distinct label is only parsed once"""
+    match = _ARC_RE.match(arc_string)
+    return int(match.group(1)) if match else 0
+
+class DebutArcMixin:
+    """
+    Compares an orderable "Debut Arc" category by the numeric prefix of its labels.
+    List it before GameDleSolver in the bases of a solver whose CSV has that column.
+    """
+    
+    def _extract_arc_number(self, arc_string: str) -> int:
+        """Extract the numeric prefix from arc string (e.g., '01. Romance Dawn' -> 1)"""
+        if pd.isna(arc_string) or not isinstance(arc_string, str):
+            return 0
+        return _parse_arc_number(arc_string)
+    
+    def preprocess_data(self):
+        """Parse each Debut Arc's numeric prefix once, so comparisons never re-run the regex"""
+        super().preprocess_data() # type: ignore
+        self._arc_numbers = np.array([self._extract_arc_number(value) for value in self.data["Debut Arc"]], dtype=np.int32) # type: ignore
+    
+    def _orderable_values(self, category: str) -> np.ndarray:
+        """Compare Debut Arc by its numeric prefix"""
+        if category == "Debut Arc":
+            return self._arc_numbers
+        return super()._orderable_values(category) # type: ignore
@@ -1,159 +1,218 @@
 import pandas as pd
+import numpy as np
 import math
 import random
 import json
 import os
-import concurrent.futures
+import shelve
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 
-# Top-level function for parallel entropy calculation
-def calculate_entropy_for_guess_parallel(args):
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, the NumPy implementations are used without it
+    njit = None
+    prange = range
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard json module is used without it
+    orjson = None
+
+# Feedback labels, indexed by the code each category type packs into a signature
+_YES_OR_NO_FEEDBACK = ('correct', 'incorrect')
+_ORDERABLE_FEEDBACK = ('lower', 'correct', 'higher')
+_PARTIAL_FEEDBACK = ('correct', 'partial', 'incorrect')
+
+# Every field of a feedback signature takes two bits of a uint64: the target name plus up to 31 categories
+_MAX_SIGNATURE_FIELDS = 32
+
+# Part of every on-disk entropy cache key; bump it whenever the way guesses are scored changes
+_SCORING_VERSION = b'expected-entropy-1'
+
+def feedback_codes(yes_or_no_mat, orderable_mat, partial_mat, guess_rows, target_rows):
     """
-    Calculate entropy for a single guess in a separate process.
-    This function must be at module level for multiprocessing.
+    Feedback code of every category for guesses against targets, along a trailing category axis.
+    Each matrix is indexed [row, category]; guess_rows and target_rows broadcast against each other,
+    so a single guess row gives one row of codes per target.
+    Categories are ordered: target name, yes/no, orderable, partial matchable.
+    The partial matchable matrix has a trailing axis of 64-bit limbs, so its bitmasks can hold any number of values.
     """
-    data, target_column, yes_or_no, orderable, partial_matchable, guess_target, current_possible_targets = args
-    
-    expected_entropy = 0
-    total_outcomes = 0
-    
-    for target in current_possible_targets:
-        feedback = simulate_feedback_parallel(data, target_column, yes_or_no, orderable, partial_matchable, guess_target, target)
-        remaining_count = count_remaining_targets_after_feedback_parallel(data, target_column, yes_or_no, orderable, partial_matchable, guess_target, feedback, current_possible_targets)
-        
-        if remaining_count > 0:
-            p = remaining_count / len(current_possible_targets)
-            expected_entropy += p * math.log2(remaining_count)
-            total_outcomes += 1
-    
-    if total_outcomes > 0:
-        expected_entropy /= total_outcomes
-    
-    return guess_target, expected_entropy
+    target_bits = partial_mat[target_rows]
+    guess_bits = partial_mat[guess_rows]
+    same_values = (target_bits == guess_bits).all(axis=-1)
+    shared_value = (target_bits & guess_bits).any(axis=-1)
+    return np.concatenate([
+        # Target name and yes/no categories: 0 correct, 1 incorrect
+        np.expand_dims(target_rows != guess_rows, -1),
+        yes_or_no_mat[target_rows] != yes_or_no_mat[guess_rows],
+        # Orderable categories: 0 lower, 1 correct, 2 higher (target compared to guess)
+        np.sign(orderable_mat[target_rows] - orderable_mat[guess_rows]) + 1,
+        # Partial matchable categories: 0 correct, 1 partial, 2 incorrect
+        np.where(same_values, 0, np.where(shared_value, 1, 2)),
+    ], axis=-1).astype(np.int8)
 
-def simulate_feedback_parallel(data, target_column, yes_or_no, orderable, partial_matchable, guess_target, target):
-    """Simulate feedback for parallel processing"""
-    guess_data = data[data[target_column] == guess_target].iloc[0]
-    target_data = data[data[target_column] == target].iloc[0]
-    
-    feedback = {}
-    
-    # Target name
-    feedback[target_column.lower()] = 'correct' if guess_target == target else 'incorrect'
-    
-    # Yes/No categories
-    for category in yes_or_no:
-        feedback[category.lower()] = 'correct' if guess_data[category] == target_data[category] else 'incorrect'
-    
-    # Orderable categories
-    for category in orderable:
-        if target_data[category] < guess_data[category]:
-            feedback[category.lower()] = 'lower'
-        elif target_data[category] > guess_data[category]:
-            feedback[category.lower()] = 'higher'
-        else:
-            feedback[category.lower()] = 'correct'
-    
-    # Partial matchable categories
-    for category in partial_matchable:
-        guess_value = guess_data[category]
-        target_value = target_data[category]
-        
-        if ',' in str(guess_value) or ',' in str(target_value):
-            guess_values = set(val.strip() for val in str(guess_value).split(','))
-            target_values = set(val.strip() for val in str(target_value).split(','))
-            
-            if guess_values == target_values:
-                feedback[category.lower()] = 'correct'
-            elif guess_values & target_values:
-                feedback[category.lower()] = 'partial'
-            else:
-                feedback[category.lower()] = 'incorrect'
+def feedback_signatures(yes_or_no_mat, orderable_mat, partial_mat, guess_row, target_rows):
+    """
+    Encode the feedback a guess gets against each target as one integer per target.
+    Every field (the target name, then each category) takes two bits of a uint64, in the order of feedback_codes,
+    so a signature holds at most _MAX_SIGNATURE_FIELDS fields; Onepiecedle's nine fields use 18 bits.
+    Targets that share a signature are exactly the targets that feedback can't tell apart.
+    """
+    codes = feedback_codes(yes_or_no_mat, orderable_mat, partial_mat, guess_row, target_rows)
+    shifts = np.arange(0, 2 * codes.shape[-1], 2, dtype=np.uint64)
+    return (codes.astype(np.uint64) << shifts).sum(axis=-1, dtype=np.uint64)
+
+def _signature_matrix_loops(yes_or_no_mat, orderable_mat, partial_mat):
+    """
+    Signature of every guess against every target, packed in the layout of feedback_signatures.
+    Loops over rows and categories instead of broadcasting, so compiled it needs no [guess, target, category] temporaries.
+    """
+    n_rows = yes_or_no_mat.shape[0]
+    one = np.uint64(1)
+    signatures = np.empty((n_rows, n_rows), dtype=np.uint64)
+    for guess in prange(n_rows):
+        for target in range(n_rows):
+            signature = np.uint64(0) if target == guess else one
+            shift = np.uint64(2)
+            for category in range(yes_or_no_mat.shape[1]):
+                if yes_or_no_mat[target, category] != yes_or_no_mat[guess, category]:
+                    signature |= one << shift
+                shift += np.uint64(2)
+            for category in range(orderable_mat.shape[1]):
+                target_rank = orderable_mat[target, category]
+                guess_rank = orderable_mat[guess, category]
+                if target_rank == guess_rank:
+                    signature |= one << shift
+                elif target_rank > guess_rank:
+                    signature |= np.uint64(2) << shift
+                shift += np.uint64(2)
+            for category in range(partial_mat.shape[1]):
+                same_values = True
+                shared_value = False
+                for limb in range(partial_mat.shape[2]):
+                    target_bits = partial_mat[target, category, limb]
+                    guess_bits = partial_mat[guess, category, limb]
+                    if target_bits != guess_bits:
+                        same_values = False
+                    if (target_bits & guess_bits) != 0:
+                        shared_value = True
+                if not same_values:
+                    signature |= (one if shared_value else np.uint64(2)) << shift
+                shift += np.uint64(2)
+            signatures[guess, target] = signature
+    return signatures
+
+_signature_matrix_jit = njit(cache=True, parallel=True)(_signature_matrix_loops) if njit is not None else None
+
+def signature_matrix(yes_or_no_mat, orderable_mat, partial_mat) -> np.ndarray:
+    """Packed feedback signature of every guess against every target, indexed [guess, target]"""
+    if _signature_matrix_jit is not None:
+        return _signature_matrix_jit(yes_or_no_mat, orderable_mat, partial_mat)
+    rows = np.arange(yes_or_no_mat.shape[0])
+    return feedback_signatures(yes_or_no_mat, orderable_mat, partial_mat, rows[:, None], rows[None, :])
+
+def _stack_columns(columns: List[np.ndarray], n_rows: int) -> np.ndarray:
+    """Stack per-category arrays into a [row, category] matrix, which is (n_rows, 0) when there are none"""
+    if not columns:
+        return np.zeros((n_rows, 0), dtype=np.int8)
+    return np.column_stack(columns)
+
+def _stack_token_bits(columns: List[np.ndarray], n_rows: int) -> np.ndarray:
+    """Stack per-category [row, limb] bitmasks into a [row, category, limb] matrix, zero-padding every column to the same limbs"""
+    n_limbs = max((bits.shape[1] for bits in columns), default=1)
+    matrix = np.zeros((n_rows, len(columns), n_limbs), dtype=np.uint64)
+    for position, bits in enumerate(columns):
+        matrix[:, position, :bits.shape[1]] = bits
+    return matrix
+
+_nlogn_table = np.zeros(1)
+
+def nlogn(counts: np.ndarray) -> np.ndarray:
+    """
+    c*log2(c) for every count, gathered from a table that grows to the largest count seen.
+    Counts are bucket sizes, never more than the number of rows, so the table is built a handful of times at most.
+    The table is read once into a local, so a smaller table published by another thread can't be indexed here.
+    """
+    global _nlogn_table
+    table = _nlogn_table
+    largest = int(counts.max(initial=0))
+    if largest >= len(table):
+        table = np.arange(max(largest + 1, 2 * len(table)), dtype=float)
+        table[1:] *= np.log2(table[1:])
+        _nlogn_table = table
+    return table[counts]
+
+def _expected_entropy_sorted_runs(signatures):
+    """Sort the signatures and accumulate c*log2(c) over each run of equal values in a single pass"""
+    ordered = np.sort(signatures)
+    total = 0.0
+    run = 1
+    for i in range(1, len(ordered)):
+        if ordered[i] == ordered[i - 1]:
+            run += 1
         else:
-            if guess_value == target_value:
-                feedback[category.lower()] = 'correct'
-            else:
-                feedback[category.lower()] = 'incorrect'
-    
-    return feedback
+            total += run * math.log2(run)
+            run = 1
+    total += run * math.log2(run)
+    return total / len(ordered)
 
-def count_remaining_targets_after_feedback_parallel(data, target_column, yes_or_no, orderable, partial_matchable, guess_target, feedback, possible_targets):
-    """Count remaining targets for parallel processing"""
-    remaining_count = 0
-    
-    for target in possible_targets:
-        if target_compatible_with_feedback_parallel(data, target_column, yes_or_no, orderable, partial_matchable, target, guess_target, feedback):
-            remaining_count += 1
-    
-    return remaining_count
+_expected_entropy_jit = njit(cache=True, nogil=True)(_expected_entropy_sorted_runs) if njit is not None else None
 
-def target_compatible_with_feedback_parallel(data, target_column, yes_or_no, orderable, partial_matchable, target, guess_target, feedback):
-    """Check target compatibility for parallel processing"""
-    target_data = data[data[target_column] == target].iloc[0]
-    guess_data = data[data[target_column] == guess_target].iloc[0]
-    
-    # Check target name feedback
-    if feedback.get(target_column.lower()) == 'correct':
-        return target == guess_target
-    elif feedback.get(target_column.lower()) == 'incorrect':
-        if target == guess_target:
-            return False
-    
-    # Check yes/no categories
-    for category in yes_or_no:
-        feedback_key = category.lower()
-        if feedback_key in feedback:
-            if feedback[feedback_key] == 'correct':
-                if target_data[category] != guess_data[category]:
-                    return False
-            elif feedback[feedback_key] == 'incorrect':
-                if target_data[category] == guess_data[category]:
-                    return False
-    
-    # Check orderable categories
-    for category in orderable:
-        feedback_key = category.lower()
-        if feedback_key in feedback:
-            if feedback[feedback_key] == 'lower':
-                if target_data[category] >= guess_data[category]:
-                    return False
-            elif feedback[feedback_key] == 'higher':
-                if target_data[category] <= guess_data[category]:
-                    return False
-            elif feedback[feedback_key] == 'correct':
-                if target_data[category] != guess_data[category]:
-                    return False
-    
-    # Check partial matchable categories
-    for category in partial_matchable:
-        feedback_key = category.lower()
-        if feedback_key in feedback:
-            target_value = target_data[category]
-            guess_value = guess_data[category]
-            
-            if feedback[feedback_key] == 'correct':
-                if target_value != guess_value:
-                    return False
-            elif feedback[feedback_key] == 'incorrect':
-                if ',' in str(target_value) and ',' in str(guess_value):
-                    target_values = set(val.strip() for val in str(target_value).split(','))
-                    guess_values = set(val.strip() for val in str(guess_value).split(','))
-                    if target_values & guess_values:
-                        return False
-                elif target_value == guess_value:
-                    return False
-            elif feedback[feedback_key] == 'partial':
-                if ',' in str(target_value) and ',' in str(guess_value):
-                    target_values = set(val.strip() for val in str(target_value).split(','))
-                    guess_values = set(val.strip() for val in str(guess_value).split(','))
-                    overlap = target_values & guess_values
-                    if not overlap or target_values == guess_values:
-                        return False
-                else:
-                    return False
-    
-    return True
+def expected_entropy_from_signatures(signatures: np.ndarray) -> float:
+    """Expected entropy left after a guess, given the feedback signature of every possible target"""
+    if _expected_entropy_jit is not None:
+        return _expected_entropy_jit(signatures)
+    _, counts = np.unique(signatures, return_counts=True)
+    return float(nlogn(counts).sum() / len(signatures))
+
+def expected_entropies(signatures: np.ndarray) -> np.ndarray:
+    """
+    Expected entropy of every row of a [guess, target] signature matrix at once.
+    Sorting each row puts equal signatures into runs, and a run of length c adds c*log2(c).
+    """
+    n_guesses, n_targets = signatures.shape
+    ordered = np.sort(signatures, axis=1)
+    run_starts = np.ones(ordered.shape, dtype=bool)
+    run_starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    # Every row starts a new run, so flattened runs never span two guesses
+    start_positions = np.flatnonzero(run_starts)
+    run_lengths = np.diff(np.append(start_positions, ordered.size))
+    totals = np.bincount(start_positions // n_targets, weights=nlogn(run_lengths), minlength=n_guesses)
+    return totals / n_targets
+
+def _pool_entropies(signature_matrix, guesses, pool):
+    """Expected entropy of every row in guesses against the targets in pool, one guess per parallel iteration"""
+    n = len(guesses)
+    entropies = np.empty(n)
+    for i in prange(n):
+        entropies[i] = _expected_entropy_jit(signature_matrix[guesses[i]][pool])
+    return entropies
+
+_pool_entropies_jit = njit(cache=True, parallel=True)(_pool_entropies) if njit is not None else None
+
+def _read_json(filename: str) -> Any:
+    """Parse a JSON file, with orjson when it is installed"""
+    if orjson is not None:
+        with open(filename, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+def write_json(filename: str, data: Any):
+    """
+    Write data as JSON indented by two spaces, with orjson when it is installed.
+    The file is written beside the target and swapped in, so readers never see a partial write.
+    """
+    temporary = f"{filename}.tmp"
+    if orjson is not None:
+        with open(temporary, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(temporary, 'w') as f:
+            json.dump(data, f, indent=2)
+    os.replace(temporary, filename)
 
 class GameDleSolver(ABC):
     """
@@ -161,6 +220,9 @@ class GameDleSolver(ABC):
     Extend this class to create solvers for different games.
     """
     
+    # Parsed optimal guesses files shared by every solver in the process, as {filename: (mtime, contents)}
+    _guesses_cache: Dict[str, Tuple[int, Any]] = {}
+    
     def __init__(self, csv_file: str, target_column: str):
         """
         Initialize the solver with game data.
@@ -169,18 +231,87 @@ class GameDleSolver(ABC):
             csv_file (str): Path to the CSV file containing game data
             target_column (str): Name of the column containing the target items to guess
         """
-        self.data = pd.read_csv(csv_file, header=0, na_values=[], keep_default_na=False)
+        # Define category types first, so the CSV can be parsed straight into the right dtypes
+        self._define_category_types()
+        # Every lookup array below is built from these lists, so they are frozen to keep them in sync
+        self.yes_or_no = tuple(self.yes_or_no) # type: ignore
+        self.orderable = tuple(self.orderable) # type: ignore
+        self.partial_matchable = tuple(self.partial_matchable) # type: ignore
+        n_fields = 1 + len(self.yes_or_no) + len(self.orderable) + len(self.partial_matchable)
+        if n_fields > _MAX_SIGNATURE_FIELDS:
+            raise ValueError(
+                f"Feedback signatures hold at most {_MAX_SIGNATURE_FIELDS - 1} categories besides the target name, "
+                f"got {n_fields - 1}"
+            )
+        
+        # Yes/no and partial matchable columns are only ever compared as labels, so they are read as categoricals
+        dtypes = {category: 'category' for category in self.yes_or_no + self.partial_matchable} # type: ignore
+        self.data = pd.read_csv(csv_file, header=0, dtype=dtypes, na_values=[], keep_default_na=False)
         self.target_column = target_column
-        self.possible_targets = self.data.copy()
+        # Feedback dictionaries are keyed by the lowercased category name
+        self._feedback_keys = {
+            category: category.lower()
+            for category in (target_column,) + self.yes_or_no + self.orderable + self.partial_matchable # type: ignore
+        }
         self.entropy_cache = {}
         self.optimal_first_guesses = None
+        self._entropy_disk = None
         
         # Validate that target column exists
         if target_column not in self.data.columns:
             raise ValueError(f"Target column '{target_column}' not found in CSV. Available columns: {self.data.columns.tolist()}")
         
-        # Define category types based on the CSV structure
-        self._define_category_types()
+        # Let subclasses adjust the raw data before it is snapshotted
+        self.preprocess_data()
+        
+        # Store the remaining non-orderable string columns as categoricals so they compare as integer codes
+        self._cat_map = {}
+        for column in self.data.columns:
+            if column == target_column or column in self.orderable: # type: ignore
+                continue
+            if not pd.api.types.is_numeric_dtype(self.data[column]):
+                self.data[column] = self.data[column].astype('category')
+                self._cat_map[column] = dict(enumerate(self.data[column].cat.categories))
+        
+        # Column-major snapshot of the data; possible targets are row indices into it
+        self._cols = {
+            column: (self.data[column].cat.codes if column in self._cat_map else self.data[column]).to_numpy()
+            for column in self.data.columns
+        }
+        self._name_to_idx = {name: i for i, name in enumerate(self._cols[target_column])}
+        self._idx = np.arange(len(self.data))
+        self._state_key = None
+        
+        # Inverted index for yes/no columns: each distinct value maps to the mask of rows holding it
+        self._inv_index = {}
+        for category in self.yes_or_no: # type: ignore
+            column = self._cols[category]
+            self._inv_index[category] = {value: column == value for value in np.unique(column)}
+        
+        # Partial matchable columns as per-row value sets and bitmasks over each column's value vocabulary
+        self._partial_sets = {}
+        self._tok_vocab = {}
+        self._tok_bits = {}
+        for category in self.partial_matchable: # type: ignore
+            self._build_token_bits(category)
+        
+        # [row, category] matrices for feedback: yes/no codes, orderable ranks and partial matchable bitmasks
+        # (the last with a trailing limb axis).
+        # Orderable columns are small integer ranks, so comparing them is a sign of a subtraction
+        n_rows = len(self.data)
+        self._yn_mat = _stack_columns([self._cols[category] for category in self.yes_or_no], n_rows) # type: ignore
+        self._ord_mat = _stack_columns([self._orderable_ranks(category) for category in self.orderable], n_rows) # type: ignore
+        self._pm_mat = _stack_token_bits([self._tok_bits[category] for category in self.partial_matchable], n_rows) # type: ignore
+        
+        # Packed feedback signature of every guess against every target, indexed [guess, target].
+        # Feedback never depends on the game state, so scoring a guess only gathers a row of it
+        self._sig = signature_matrix(*self._signature_matrices())
+        # Fingerprint of the data, so entropies persisted for another version of the CSV are never reused
+        self._data_digest = hashlib.blake2b(self._sig.tobytes(), digest_size=16).digest()
+        self._feedback_labels = self._signature_labels()
+        # Rows whose feedback differs only in the name field are interchangeable guesses: they score the same
+        # against any pool holding both, so each class of them is scored once through a representative
+        self._equiv_class = np.unique(self._sig >> np.uint64(2), axis=0, return_inverse=True)[1].reshape(-1)
         
         # Load optimal first guesses
         self._load_optimal_first_guesses()
@@ -193,6 +324,7 @@ class GameDleSolver(ABC):
         - partial_matchable: Categories that can have partial matches (comma-separated values)
         - yes_or_no: Categories that are exact match or not
         - orderable: Categories that can be compared (before/after/correct)
+        Called before the CSV is read, so self.data is not available here.
         """
         pass
     
@@ -215,9 +347,83 @@ class GameDleSolver(ABC):
         """
         pass
     
+    def preprocess_data(self):
+        """
+        Adjust self.data before the column arrays are built.
+        Override this method in subclasses that need to clean or reshape columns.
+        """
+        pass
+    
+    def _split_values(self, category: str, value: Any) -> Set[str]:
+        """
+        Split a partial matchable cell into its set of values.
+        Override this method to normalize values of specific categories.
+        """
+        return set(val.strip() for val in str(value).split(','))
+    
+    def _build_token_bits(self, category: str):
+        """
+        Split a partial matchable column once into per-row value sets, and encode them as one bitmask per row.
+        Each distinct value is interned to a small int id, which is also its bit in the mask.
+        Masks are split into as many 64-bit limbs as the column's vocabulary needs, giving a [row, limb] array.
+        """
+        value_sets = [self._split_values(category, value) for value in self.data[category]]
+        vocab = {token: bit for bit, token in enumerate(sorted(set().union(*value_sets)))}
+        self._partial_sets[category] = [frozenset(vocab[token] for token in values) for values in value_sets]
+        self._tok_vocab[category] = vocab
+        n_limbs = max(1, -(-len(vocab) // 64))
+        masks = [sum(1 << bit for bit in values) for values in self._partial_sets[category]]
+        self._tok_bits[category] = np.array(
+            [[(mask >> (64 * limb)) & 0xFFFFFFFFFFFFFFFF for limb in range(n_limbs)] for mask in masks],
+            dtype=np.uint64
+        ).reshape(len(masks), n_limbs)
+    
+    def _orderable_values(self, category: str) -> np.ndarray:
+        """
+        Return the values an orderable category is compared by, one per row.
+        Override this method for categories whose raw values don't sort correctly.
+        """
+        return self._cols[category]
+    
+    def _orderable_ranks(self, category: str) -> np.ndarray:
+        """Rank each row's orderable value among the column's distinct values, in the narrowest signed dtype"""
+        distinct, ranks = np.unique(self._orderable_values(category), return_inverse=True)
+        dtype = np.int8 if len(distinct) <= np.iinfo(np.int8).max else np.int32
+        return ranks.astype(dtype)
+    
+    def _signature_matrices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """The yes/no, orderable and partial matchable matrices feedback is computed from"""
+        return self._yn_mat, self._ord_mat, self._pm_mat
+    
+    def _signature_labels(self) -> List[Tuple[str, Tuple[str, ...]]]:
+        """Feedback key and labels for each two-bit field of a signature, in packing order"""
+        return (
+            [(self._feedback_keys[self.target_column], _YES_OR_NO_FEEDBACK)] +
+            [(self._feedback_keys[category], _YES_OR_NO_FEEDBACK) for category in self.yes_or_no] + # type: ignore
+            [(self._feedback_keys[category], _ORDERABLE_FEEDBACK) for category in self.orderable] + # type: ignore
+            [(self._feedback_keys[category], _PARTIAL_FEEDBACK) for category in self.partial_matchable] # type: ignore
+        )
+    
+    def _feedback_signatures(self, guess_row: int, target_rows: np.ndarray) -> np.ndarray:
+        """Feedback signatures of a guess against the given target rows"""
+        return self._sig[guess_row, target_rows]
+    
+    @property
+    def possible_targets(self) -> pd.DataFrame:
+        """DataFrame view of the remaining possible targets"""
+        return self.data.iloc[self._idx]
+    
+    def close(self):
+        """Close the on-disk entropy cache"""
+        # An empty shelf is falsy, so compare against the False marker explicitly
+        if self._entropy_disk is not None and self._entropy_disk is not False:
+            self._entropy_disk.close()
+        self._entropy_disk = None
+    
     def reset(self):
         """Reset the solver to consider all targets"""
-        self.possible_targets = self.data.copy()
+        self._idx = np.arange(len(self.data))
+        self._state_key = None
         self.entropy_cache.clear()
     
     def apply_guess(self, target_name: str, feedback: Dict[str, str]):
@@ -228,99 +434,96 @@ class GameDleSolver(ABC):
             target_name (str): The target that was guessed
             feedback (dict): Dictionary with feedback for each category
         """
-        guessed_target = self.data[self.data[self.target_column] == target_name].iloc[0]
+        guess_idx = self._name_to_idx[target_name]
         
         # Filter based on target name
-        if feedback.get(self.target_column.lower()) == 'correct':
-            self.possible_targets = self.possible_targets[self.possible_targets[self.target_column] == target_name]
+        name_key = self._feedback_keys[self.target_column]
+        if feedback.get(name_key) == 'correct':
+            self._idx = self._idx[self._idx == guess_idx]
+            self._state_key = None
             self.entropy_cache.clear()
             return
         
         # Remove the target column from feedback to avoid KeyError in filters
-        filtered_feedback = {k: v for k, v in feedback.items() if k != self.target_column.lower()}
-        
-        # Apply filters based on category types
-        self._apply_yes_or_no_filters(guessed_target, filtered_feedback)
-        self._apply_orderable_filters(guessed_target, filtered_feedback)
-        self._apply_partial_matchable_filters(guessed_target, filtered_feedback)
-        
-        # Clear cache since the game state has changed
-        self.entropy_cache.clear()
+        filtered_feedback = {k: v for k, v in feedback.items() if k != name_key}
+        
+        # Each filter narrows a single boolean mask; the targets are sliced once at the end
+        mask = np.ones(len(self._idx), dtype=bool)
+        self._apply_yes_or_no_filters(guess_idx, filtered_feedback, mask)
+        self._apply_orderable_filters(guess_idx, filtered_feedback, mask)
+        self._apply_partial_matchable_filters(guess_idx, filtered_feedback, mask)
+        
+        # Filters only ever remove targets, so the state changed iff something was removed
+        if not mask.all():
+            self._idx = self._idx[mask]
+            self._state_key = None
+            # Clear cache since the game state has changed
+            self.entropy_cache.clear()
     
-    def _apply_yes_or_no_filters(self, guessed_target: pd.Series, feedback: Dict[str, str]):
+    def _apply_yes_or_no_filters(self, guess_idx: int, feedback: Dict[str, str], mask: np.ndarray):
         """Apply filters for yes/no categories"""
         for category in self.yes_or_no: # type: ignore
-            feedback_key = category.lower()
+            feedback_key = self._feedback_keys[category]
             column_name = category
             if feedback_key in feedback:
-                if column_name not in self.possible_targets.columns:
+                if column_name not in self._inv_index:
                     continue
+                matches = self._inv_index[column_name][self._cols[column_name][guess_idx]][self._idx]
                 if feedback[feedback_key] == 'correct':
-                    self.possible_targets = self.possible_targets[self.possible_targets[column_name] == guessed_target[column_name]]
+                    mask &= matches
                 elif feedback[feedback_key] == 'incorrect':
-                    self.possible_targets = self.possible_targets[self.possible_targets[column_name] != guessed_target[column_name]]
+                    mask &= ~matches
     
-    def _apply_orderable_filters(self, guessed_target: pd.Series, feedback: Dict[str, str]):
-        """Apply filters for orderable categories"""
-        for category in self.orderable: # type: ignore
-            feedback_key = category.lower()
-            column_name = category
+    def _apply_orderable_filters(self, guess_idx: int, feedback: Dict[str, str], mask: np.ndarray):
+        """
+        Apply filters for orderable categories.
+        Values are compared by their precomputed integer ranks, which follow _orderable_values.
+        """
+        for position, category in enumerate(self.orderable): # type: ignore
+            feedback_key = self._feedback_keys[category]
             if feedback_key in feedback:
-                if column_name not in self.possible_targets.columns:
-                    continue
+                ranks = self._ord_mat[self._idx, position]
+                guessed_rank = self._ord_mat[guess_idx, position]
                 if feedback[feedback_key] == 'lower':
-                    self.possible_targets = self.possible_targets[self.possible_targets[column_name] < guessed_target[column_name]]
+                    mask &= ranks < guessed_rank
                 elif feedback[feedback_key] == 'higher':
-                    self.possible_targets = self.possible_targets[self.possible_targets[column_name] > guessed_target[column_name]]
+                    mask &= ranks > guessed_rank
                 elif feedback[feedback_key] == 'correct':
-                    self.possible_targets = self.possible_targets[self.possible_targets[column_name] == guessed_target[column_name]]
+                    mask &= ranks == guessed_rank
     
-    def _apply_partial_matchable_filters(self, guessed_target: pd.Series, feedback: Dict[str, str]):
+    def _apply_partial_matchable_filters(self, guess_idx: int, feedback: Dict[str, str], mask: np.ndarray):
         """Apply filters for partial matchable categories"""
         for category in self.partial_matchable: # type: ignore
-            feedback_key = category.lower()
+            feedback_key = self._feedback_keys[category]
             column_name = category
             if feedback_key in feedback:
-                if column_name not in self.possible_targets.columns:
+                if column_name not in self._tok_bits:
                     continue
-                guessed_value = guessed_target[column_name]
+                bits = self._tok_bits[column_name][self._idx]
+                guessed_bits = self._tok_bits[column_name][guess_idx]
+                
+                same_values = (bits == guessed_bits).all(axis=-1)
+                shared_value = (bits & guessed_bits).any(axis=-1)
                 
                 if feedback[feedback_key] == 'correct':
                     # Keep only exact matches
-                    self.possible_targets = self.possible_targets[self.possible_targets[column_name] == guessed_value]
+                    mask &= same_values
                 
                 elif feedback[feedback_key] == 'incorrect':
                     # Remove all partial and complete matches
-                    if ',' in str(guessed_value):
-                        guessed_values = set(val.strip() for val in str(guessed_value).split(','))
-                        self.possible_targets = self.possible_targets[
-                            ~self.possible_targets[column_name].apply(
-                                lambda x: bool(set(val.strip() for val in str(x).split(',')) & guessed_values)
-                            )
-                        ]
-                    else:
-                        self.possible_targets = self.possible_targets[self.possible_targets[column_name] != guessed_value]
+                    mask &= ~shared_value
                 
                 elif feedback[feedback_key] == 'partial':
                     # Remove exact matches and remove targets where no value matches
-                    if ',' in str(guessed_value):
-                        guessed_values = set(val.strip() for val in str(guessed_value).split(','))
-                        self.possible_targets = self.possible_targets[
-                            self.possible_targets[column_name].apply(
-                                lambda x: x != guessed_value and bool(set(val.strip() for val in str(x).split(',')) & guessed_values)
-                            )
-                        ]
-                    else:
-                        # For single values, partial is not possible, so treat as incorrect
-                        self.possible_targets = self.possible_targets[self.possible_targets[column_name] != guessed_value]
+                    mask &= shared_value & ~same_values
     
     def get_possible_targets(self) -> List[str]:
         """Get the list of remaining possible targets"""
-        return self.possible_targets[self.target_column].tolist()
+        return self._cols[self.target_column][self._idx].tolist()
     
     def get_target_count(self) -> int:
         """Get the number of remaining possible targets"""
-        return len(self.possible_targets)
+        return len(self._idx)
     
     def calculate_entropy(self, probabilities: List[float]) -> float:
         """Calculate entropy given a list of probabilities"""
@@ -330,91 +533,94 @@ class GameDleSolver(ABC):
                 entropy -= p * math.log2(p)
         return entropy
     
-    def _get_cache_key(self, guess_target: str) -> Tuple[str, Tuple[str, ...]]:
+    def _get_state_key(self) -> bytes:
+        """
+        Identify the current game state by a 128-bit digest of the bitmask of remaining rows.
+        It is built once per state and reset whenever the possible targets change.
+        """
+        if self._state_key is None:
+            self._state_key = self._rows_digest(self._idx)
+        return self._state_key
+    
+    def _rows_digest(self, rows: np.ndarray) -> bytes:
+        """128-bit digest of the bitmask of the given rows"""
+        alive = np.zeros(len(self.data), dtype=bool)
+        alive[rows] = True
+        return hashlib.blake2b(np.packbits(alive).tobytes(), digest_size=16).digest()
+    
+    def _get_cache_key(self, guess_target: str) -> Tuple[str, bytes]:
         """Generate a cache key for a specific guess and current game state"""
-        possible_targets_tuple = tuple(sorted(self.possible_targets[self.target_column].tolist()))
-        return (guess_target, possible_targets_tuple)
+        return (guess_target, self._get_state_key())
     
     def get_optimal_guess(self) -> Optional[str]:
         """
         Find the optimal guess by minimizing expected entropy.
         Returns the target that would provide the most information gain.
-        Uses parallel processing for faster calculation.
+        Every candidate is scored in one batch, across every core when numba is installed.
         """
-        if len(self.possible_targets) <= 1:
-            return self.possible_targets[self.target_column].iloc[0] if len(self.possible_targets) == 1 else None
+        if len(self._idx) <= 1:
+            return self._cols[self.target_column][self._idx[0]] if len(self._idx) == 1 else None
         
         # If there are exactly 2 possibilities, just pick one of them
-        if len(self.possible_targets) == 2:
-            return self.possible_targets[self.target_column].iloc[0]
+        if len(self._idx) == 2:
+            return self._cols[self.target_column][self._idx[0]]
+        
+        # If no category tells the remaining targets apart, every guess scores the same
+        if self._targets_indistinguishable():
+            return self._cols[self.target_column][self._idx[0]]
         
         # Check if we're at the initial state and have preloaded first guesses
-        if len(self.possible_targets) == len(self.data):
+        if len(self._idx) == len(self.data):
             first_guess = self.get_optimal_first_guess_for_current_state()
             if first_guess:
                 return first_guess
         
-        # Use parallel processing for optimal guess calculation
-        return self._get_optimal_guess_parallel()
+        return self._get_scored_optimal_guess()
     
-    def _get_optimal_guess_parallel(self) -> Optional[str]:
+    def _targets_indistinguishable(self) -> bool:
+        """Check whether every category has the same value across all remaining targets"""
+        for matrix in self._signature_matrices():
+            values = matrix[self._idx]
+            if (values != values[0]).any():
+                return False
+        return True
+    
+    def _get_scored_optimal_guess(self) -> Optional[str]:
         """
-        Find the optimal guess using parallel processing.
+        Find the optimal guess by scoring every remaining target as a guess in one batch.
         Now uses orderable split score as a secondary ranking factor.
         """
-        current_possible_targets = self.possible_targets[self.target_column].tolist()
+        current_possible_targets = self.get_possible_targets()
         if len(current_possible_targets) <= 10:
-            return self._get_optimal_guess_sequential()
-        args_list = []
-        for guess in current_possible_targets:
-            args = (
-                self.data,
-                self.target_column,
-                self.yes_or_no, # type: ignore
-                self.orderable, # type: ignore
-                self.partial_matchable, # type: ignore
-                guess,
-                current_possible_targets
-            )
-            args_list.append(args)
-        best_guess = None
-        best_expected_entropy = float('inf')
-        best_split_score = float('inf')
-        with concurrent.futures.ProcessPoolExecutor() as executor:
-            future_to_guess = {executor.submit(calculate_entropy_for_guess_parallel, args): args[5] for args in args_list}
-            for future in concurrent.futures.as_completed(future_to_guess):
-                guess, expected_entropy = future.result()
-                cache_key = self._get_cache_key(guess)
-                if cache_key in self.entropy_cache:
-                    expected_entropy = self.entropy_cache[cache_key]
-                else:
-                    self.entropy_cache[cache_key] = expected_entropy
-                split_score = self._orderable_split_score(guess, current_possible_targets)
-                if (expected_entropy < best_expected_entropy or
-                    (math.isclose(expected_entropy, best_expected_entropy) and split_score < best_split_score)):
-                    best_expected_entropy = expected_entropy
-                    best_split_score = split_score
-                    best_guess = guess
-        return best_guess
+            # Small pools are scored faster than a round trip through the on-disk cache
+            return self._best_scored_guess(current_possible_targets, self._guess_entropies(self._idx))
+        # States scored in an earlier session are answered from the on-disk cache
+        entropies = self._load_state_entropies()
+        if entropies is None:
+            entropies = self._guess_entropies(self._idx)
+            self._save_state_entropies(entropies)
+        return self._best_scored_guess(current_possible_targets, entropies)
+    
+    def _guess_classes(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Group rows into classes of interchangeable guesses.
+        Returns the positions in rows of one representative per class, and for each row the index of its class,
+        so scores of the representatives expand back to every row with scores[classes].
+        """
+        _, representatives, classes = np.unique(self._equiv_class[rows], return_index=True, return_inverse=True)
+        return representatives, classes
     
-    def _get_optimal_guess_sequential(self) -> Optional[str]:
+    def _best_scored_guess(self, guesses: List[str], entropies: np.ndarray) -> Optional[str]:
         """
-        Find the optimal guess using the original sequential method.
-        Used for small target pools where parallel overhead isn't worth it.
-        Now uses orderable split score as a secondary ranking factor.
+        Pick the guess with the lowest expected entropy from precomputed scores, caching them.
+        Ties are broken by the orderable split score.
         """
-        current_possible_targets = self.possible_targets[self.target_column].tolist()
         best_guess = None
         best_expected_entropy = float('inf')
         best_split_score = float('inf')
-        for guess_target in current_possible_targets:
-            cache_key = self._get_cache_key(guess_target)
-            if cache_key in self.entropy_cache:
-                expected_entropy = self.entropy_cache[cache_key]
-            else:
-                expected_entropy = self._calculate_expected_entropy(guess_target)
-                self.entropy_cache[cache_key] = expected_entropy
-            split_score = self._orderable_split_score(guess_target, current_possible_targets)
+        for guess_target, expected_entropy in zip(guesses, entropies):
+            expected_entropy = self.entropy_cache.setdefault(self._get_cache_key(guess_target), float(expected_entropy))
+            split_score = self._orderable_split_score(guess_target)
             if (expected_entropy < best_expected_entropy or
                 (math.isclose(expected_entropy, best_expected_entropy) and split_score < best_split_score)):
                 best_expected_entropy = expected_entropy
@@ -423,83 +629,35 @@ class GameDleSolver(ABC):
         return best_guess
     
     def _calculate_expected_entropy(self, guess_target: str) -> float:
-        """Calculate the expected entropy for a specific guess"""
-        expected_entropy = 0
-        total_outcomes = 0
-        
-        for target in self.possible_targets[self.target_column]:
-            feedback = self._simulate_feedback(guess_target, target)
-            
-            # Manually apply the feedback to count remaining targets without creating solver instances
-            remaining_count = self._count_remaining_targets_after_feedback(guess_target, feedback, self.possible_targets[self.target_column].tolist())
-            
-            if remaining_count > 0:
-                p = remaining_count / len(self.possible_targets)
-                expected_entropy += p * math.log2(remaining_count)
-                total_outcomes += 1
-        
-        if total_outcomes > 0:
-            expected_entropy /= total_outcomes
-        
-        return expected_entropy
+        """
+        Calculate the expected entropy for a specific guess.
+        Possible targets are bucketed by the feedback they would produce, so each
+        bucket's size is the number of targets left after that feedback.
+        """
+        signatures = self._feedback_signatures(self._name_to_idx[guess_target], self._idx)
+        return expected_entropy_from_signatures(signatures)
     
     def _simulate_feedback(self, guess_target: str, target: str) -> Dict[str, str]:
         """Simulate what feedback would be given for a guess against a target"""
-        guess_data = self.data[self.data[self.target_column] == guess_target].iloc[0]
-        target_data = self.data[self.data[self.target_column] == target].iloc[0]
+        signature = int(self._sig[self._name_to_idx[guess_target], self._name_to_idx[target]])
         
         feedback = {}
-        
-        # Target name
-        feedback[self.target_column.lower()] = 'correct' if guess_target == target else 'incorrect'
-        
-        # Yes/No categories
-        for category in self.yes_or_no: # type: ignore
-            feedback[category.lower()] = 'correct' if guess_data[category] == target_data[category] else 'incorrect' # type: ignore
-        
-        # Orderable categories
-        for category in self.orderable: # type: ignore
-            # Corrected logic: compare target to guess
-            if target_data[category] < guess_data[category]: # type: ignore
-                feedback[category.lower()] = 'lower'
-            elif target_data[category] > guess_data[category]: # type: ignore
-                feedback[category.lower()] = 'higher'
-            else:
-                feedback[category.lower()] = 'correct'
-        
-        # Partial matchable categories
-        for category in self.partial_matchable: # type: ignore
-            guess_value = guess_data[category]
-            target_value = target_data[category]
-            
-            if ',' in str(guess_value) or ',' in str(target_value):
-                guess_values = set(val.strip() for val in str(guess_value).split(','))
-                target_values = set(val.strip() for val in str(target_value).split(','))
-                
-                if guess_values == target_values:
-                    feedback[category.lower()] = 'correct'
-                elif guess_values & target_values:
-                    feedback[category.lower()] = 'partial'
-                else:
-                    feedback[category.lower()] = 'incorrect'
-            else:
-                if guess_value == target_value: # type: ignore
-                    feedback[category.lower()] = 'correct'
-                else:
-                    feedback[category.lower()] = 'incorrect'
+        for feedback_key, labels in self._feedback_labels:
+            feedback[feedback_key] = labels[signature & 3]
+            signature >>= 2
         
         return feedback
     
     def get_target_info(self, target_name: str) -> Dict[str, Any]:
         """Get information about a specific target"""
-        target_data = self.data[self.data[self.target_column] == target_name]
-        if target_data.empty:
+        row = self._name_to_idx.get(target_name)
+        if row is None:
             return {}
         
         info = {}
-        for column in self.data.columns:
+        for position, column in enumerate(self.data.columns):
             if column != self.target_column:
-                info[column] = target_data[column].iloc[0]
+                info[column] = self.data.iat[row, position]
         
         return info
     
@@ -673,14 +831,59 @@ class GameDleSolver(ABC):
         """Get the filename for storing optimal first guesses"""
         return "optimal_guesses.json"
 
+    def _get_entropy_cache_filename(self) -> str:
+        """Get the filename (without the dbm extension) of the on-disk entropy cache"""
+        return f"entropy_cache_{self.get_display_name().lower()}"
+    
+    def _get_entropy_disk(self) -> Optional[shelve.Shelf]:
+        """Open the on-disk entropy cache on first use; None if it can't be opened"""
+        if self._entropy_disk is None:
+            try:
+                self._entropy_disk = shelve.open(self._get_entropy_cache_filename())
+            except Exception as e:
+                print(f"Error opening entropy cache {self._get_entropy_cache_filename()}: {e}")
+                self._entropy_disk = False
+        # An empty shelf is falsy, so compare against the False marker explicitly
+        return None if self._entropy_disk is False else self._entropy_disk
+    
+    def _get_disk_cache_key(self, rows: Optional[np.ndarray] = None) -> str:
+        """
+        Key of a state in the on-disk entropy cache: a digest of the scoring version, the data and the remaining rows.
+        The state is the current one unless rows are given.
+        """
+        state_key = self._get_state_key() if rows is None else self._rows_digest(rows)
+        return hashlib.blake2b(_SCORING_VERSION + self._data_digest + state_key, digest_size=16).hexdigest()
+    
+    def _load_state_entropies(self, rows: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Expected entropy of every remaining target as a guess, if this state was scored before"""
+        disk = self._get_entropy_disk()
+        if disk is None:
+            return None
+        return disk.get(self._get_disk_cache_key(rows))
+    
+    def _save_state_entropies(self, entropies: np.ndarray, rows: Optional[np.ndarray] = None):
+        """Persist the expected entropy of every remaining target as a guess for a state"""
+        disk = self._get_entropy_disk()
+        if disk is not None:
+            disk[self._get_disk_cache_key(rows)] = np.asarray(entropies, dtype=float)
+    
+    def _read_optimal_guesses_file(self, filename: str) -> Any:
+        """Contents of the optimal guesses file, parsed once per process unless the file changes on disk"""
+        mtime = os.stat(filename).st_mtime_ns
+        cached = GameDleSolver._guesses_cache.get(filename)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        all_guesses = _read_json(filename)
+        GameDleSolver._guesses_cache[filename] = (mtime, all_guesses)
+        return all_guesses
+    
     def _load_optimal_first_guesses(self):
         filename = self._get_optimal_guesses_filename()
         game_name = self.get_display_name()
         
         if os.path.exists(filename):
             try:
-                with open(filename, 'r') as f:
-                    all_guesses = json.load(f)
+                all_guesses = self._read_optimal_guesses_file(filename)
                 
                 if isinstance(all_guesses, dict) and game_name in all_guesses:
                     self.optimal_first_guesses = all_guesses[game_name]
@@ -710,15 +913,14 @@ class GameDleSolver(ABC):
             # Load existing guesses or create new dict
             all_guesses = {}
             if os.path.exists(filename):
-                with open(filename, 'r') as f:
-                    all_guesses = json.load(f)
+                all_guesses = dict(self._read_optimal_guesses_file(filename))
             
             # Update with new guess
             all_guesses[game_name] = self.optimal_first_guesses
             
             # Save back to file
-            with open(filename, 'w') as f:
-                json.dump(all_guesses, f, indent=2)
+            write_json(filename, all_guesses)
+            GameDleSolver._guesses_cache[filename] = (os.stat(filename).st_mtime_ns, all_guesses)
             print(f"Saved optimal first guess for {game_name}: {self.optimal_first_guesses}")
         except Exception as e:
             print(f"Error saving optimal guesses to {filename}: {e}")
@@ -726,166 +928,51 @@ class GameDleSolver(ABC):
     def _calculate_optimal_first_guesses(self) -> str:
         """
         Calculate the optimal first guess that works well across all targets.
-        This is computationally expensive and should only be done once.
-        Uses parallel processing for significant speedup.
+        Every guess is scored against every target straight from the precomputed signature matrix.
         """
-        print("Calculating optimal first guess using parallel processing... This may take a while.")
+        print("Calculating optimal first guess...")
         
         all_targets = self.data[self.target_column].tolist()
         print(f"Total targets to evaluate: {len(all_targets)}")
         
-        # Prepare arguments for parallel processing
-        args_list = []
-        for guess in all_targets:
-            args = (
-                self.data,
-                self.target_column,
-                self.yes_or_no, # type: ignore
-                self.orderable, # type: ignore
-                self.partial_matchable, # type: ignore
-                guess,
-                all_targets
-            )
-            args_list.append(args)
+        # Scores of the initial state only depend on the data, so they are cached on disk under its digest
+        all_rows = np.arange(len(all_targets))
+        entropies = self._load_state_entropies(all_rows)
+        if entropies is None:
+            entropies = self._guess_entropies(all_rows)
+            self._save_state_entropies(entropies, all_rows)
         
         best_guess = None
         best_overall_entropy = float('inf')
         
-        # Use ProcessPoolExecutor for parallel processing
-        with concurrent.futures.ProcessPoolExecutor() as executor:
-            print(f"Starting parallel processing with {executor._max_workers} workers...") # type: ignore
-            
-            # Submit all tasks and collect results
-            future_to_guess = {executor.submit(calculate_entropy_for_guess_parallel, args): args[5] for args in args_list}
-            
-            completed = 0
-            for future in concurrent.futures.as_completed(future_to_guess):
-                guess, avg_entropy = future.result()
-                completed += 1
-                print(f"Completed {completed}/{len(all_targets)}: '{guess}' - entropy: {avg_entropy:.2f}")
-                
-                if avg_entropy < best_overall_entropy:
-                    best_overall_entropy = avg_entropy
-                    best_guess = guess
-                    print(f"    NEW BEST GUESS: {best_guess} (entropy: {best_overall_entropy:.2f})")
+        for guess, avg_entropy in zip(all_targets, entropies):
+            if avg_entropy < best_overall_entropy:
+                best_overall_entropy = avg_entropy
+                best_guess = guess
+                print(f"    NEW BEST GUESS: {best_guess} (entropy: {best_overall_entropy:.2f})")
         
         print(f"Best overall first guess: {best_guess} (avg entropy: {best_overall_entropy:.2f})")
         return best_guess # type: ignore
     
-    def _calculate_expected_entropy_isolated(self, guess_target: str) -> float:
+    def _guess_entropies(self, rows: np.ndarray) -> np.ndarray:
         """
-        Calculate expected entropy for a guess without creating temporary solver instances.
-        This method is isolated and doesn't trigger loading/saving logic.
+        Expected entropy of every row as a guess against the targets in rows, in row order;
+        interchangeable rows are scored once.
+        With numba one compiled call spreads the guesses across every core; otherwise blocks of rows of
+        the signature matrix are scored with one batched NumPy reduction each.
         """
-        expected_entropy = 0
-        total_outcomes = 0
-        
-        # Use the current state of possible_targets (should be all targets during precompute)
-        current_possible_targets = self.possible_targets[self.target_column].tolist()
-        
-        for idx, target in enumerate(current_possible_targets):
-            if idx % 50 == 0:
-                print(f"      [debug] Entropy calc for guess '{guess_target}': {idx+1}/{len(current_possible_targets)} targets")
-            feedback = self._simulate_feedback(guess_target, target)
-            
-            # Manually apply the feedback to count remaining targets
-            remaining_count = self._count_remaining_targets_after_feedback(guess_target, feedback, current_possible_targets)
-            
-            if remaining_count > 0:
-                p = remaining_count / len(current_possible_targets)
-                expected_entropy += p * math.log2(remaining_count)
-                total_outcomes += 1
-        
-        if total_outcomes > 0:
-            expected_entropy /= total_outcomes
-        
-        return expected_entropy
-    
-    def _count_remaining_targets_after_feedback(self, guess_target: str, feedback: Dict[str, str], possible_targets: List[str]) -> int:
-        """
-        Count how many targets would remain after applying feedback, without creating solver instances.
-        """
-        remaining_count = 0
-        
-        for target in possible_targets:
-            # Check if this target is compatible with the feedback
-            if self._target_compatible_with_feedback(target, guess_target, feedback):
-                remaining_count += 1
-        
-        return remaining_count
-    
-    def _target_compatible_with_feedback(self, target: str, guess_target: str, feedback: Dict[str, str]) -> bool:
-        """
-        Check if a target is compatible with the given feedback for a guess.
-        """
-        # Get the data for both target and guess
-        target_data = self.data[self.data[self.target_column] == target].iloc[0]
-        guess_data = self.data[self.data[self.target_column] == guess_target].iloc[0]
-        
-        # Check target name feedback
-        if feedback.get(self.target_column.lower()) == 'correct':
-            return target == guess_target
-        elif feedback.get(self.target_column.lower()) == 'incorrect':
-            if target == guess_target:
-                return False
-        
-        # Check yes/no categories
-        for category in self.yes_or_no: # type: ignore
-            feedback_key = category.lower()
-            if feedback_key in feedback:
-                if feedback[feedback_key] == 'correct':
-                    if target_data[category] != guess_data[category]: # type: ignore
-                        return False
-                elif feedback[feedback_key] == 'incorrect':
-                    if target_data[category] == guess_data[category]: # type: ignore
-                        return False
-        
-        # Check orderable categories
-        for category in self.orderable: # type: ignore
-            feedback_key = category.lower()
-            if feedback_key in feedback:
-                if feedback[feedback_key] == 'lower':
-                    if target_data[category] >= guess_data[category]: # type: ignore
-                        return False
-                elif feedback[feedback_key] == 'higher':
-                    if target_data[category] <= guess_data[category]: # type: ignore
-                        return False
-                elif feedback[feedback_key] == 'correct':
-                    if target_data[category] != guess_data[category]: # type: ignore
-                        return False
-        
-        # Check partial matchable categories
-        for category in self.partial_matchable: # type: ignore
-            feedback_key = category.lower()
-            if feedback_key in feedback:
-                target_value = target_data[category]
-                guess_value = guess_data[category]
-                
-                if feedback[feedback_key] == 'correct':
-                    if target_value != guess_value: # type: ignore
-                        return False
-                elif feedback[feedback_key] == 'incorrect':
-                    # Check if there's any overlap
-                    if ',' in str(target_value) and ',' in str(guess_value):
-                        target_values = set(val.strip() for val in str(target_value).split(','))
-                        guess_values = set(val.strip() for val in str(guess_value).split(','))
-                        if target_values & guess_values:  # If there's any overlap
-                            return False
-                    elif target_value == guess_value: # type: ignore
-                        return False
-                elif feedback[feedback_key] == 'partial':
-                    # Check if there's partial overlap but not exact match
-                    if ',' in str(target_value) and ',' in str(guess_value):
-                        target_values = set(val.strip() for val in str(target_value).split(','))
-                        guess_values = set(val.strip() for val in str(guess_value).split(','))
-                        overlap = target_values & guess_values
-                        if not overlap or target_values == guess_values:  # No overlap or exact match
-                            return False
-                    else:
-                        # For single values, partial is not possible
-                        return False
-        
-        return True
+        representatives, classes = self._guess_classes(rows)
+        guess_rows = rows[representatives]
+        if _pool_entropies_jit is not None:
+            return _pool_entropies_jit(self._sig, guess_rows, rows)[classes]
+        
+        # Blocks bound the memory of the sorted copy for large datasets
+        block_size = 256
+        entropies = np.concatenate([
+            expected_entropies(self._sig[np.ix_(guess_rows[start:start + block_size], rows)])
+            for start in range(0, len(guess_rows), block_size)
+        ])
+        return entropies[classes]
     
     def get_optimal_first_guess(self) -> Optional[str]:
         if self.optimal_first_guesses is None:
@@ -901,7 +988,7 @@ class GameDleSolver(ABC):
         Otherwise, fall back to the regular optimal guess calculation.
         """
         # Check if we're at the initial state (all targets possible)
-        if len(self.possible_targets) == len(self.data):
+        if len(self._idx) == len(self.data):
             # We're at the beginning, use preloaded optimal first guess
             optimal_guess = self.get_optimal_first_guess()
             if optimal_guess:
@@ -909,11 +996,8 @@ class GameDleSolver(ABC):
                 return optimal_guess
         
         # Not at initial state or no preloaded guesses, use regular optimal guess calculation
-        # Avoid recursive call by directly using the parallel or sequential method
-        if len(self.possible_targets) <= 10:
-            return self._get_optimal_guess_sequential()
-        else:
-            return self._get_optimal_guess_parallel() 
+        # Avoid recursive call by directly scoring the remaining targets
+        return self._get_scored_optimal_guess()
 
     def _orderable_split_score(self, guess_target: str, possible_targets: Optional[List[str]] = None) -> int:
         """
@@ -922,20 +1006,11 @@ class GameDleSolver(ABC):
         Lower is better (more even split).
         """
         if possible_targets is None:
-            possible_targets = self.possible_targets[self.target_column].tolist()
-        guess_data = self.data[self.data[self.target_column] == guess_target].iloc[0]
-        max_group_size = 0
-        for category in self.orderable:  # type: ignore
-            lower_count = 0
-            higher_count = 0
-            correct_count = 0
-            for target in possible_targets:
-                target_data = self.data[self.data[self.target_column] == target].iloc[0]
-                if target_data[category] < guess_data[category]: # type: ignore
-                    lower_count += 1
-                elif target_data[category] > guess_data[category]: # type: ignore
-                    higher_count += 1
-                else:
-                    correct_count += 1
-            max_group_size = max(max_group_size, lower_count, higher_count, correct_count)
-        return max_group_size 
\ No newline at end of file
+            target_rows = self._idx
+        else:
+            target_rows = np.array([self._name_to_idx[target] for target in possible_targets], dtype=np.intp)
+        guess_row = self._name_to_idx[guess_target]
+        if self._ord_mat.shape[1] == 0:
+            return 0
+        codes = np.sign(self._ord_mat[target_rows] - self._ord_mat[guess_row]) + 1
+        return max(int((codes == code).sum(axis=0).max()) for code in range(3)) 
\ No newline at end of file
@@ -1,8 +1,7 @@
-import json
-import os
-from LoldleSolver import LolDleSolver
+from GameDleSolver import write_json
+from LolDleSolver import LolDleSolver
 from NarutodleSolver import MyGameSolver as NarutodleSolver
-from OnepiecedleSolver import OnePieceDleSolver
+from OnePieceDleSolver import OnePieceDleSolver
 from WarframedleSolver import Warframedle
 
 def main():
@@ -12,15 +11,17 @@ def main():
         OnePieceDleSolver(),
         Warframedle(),
     ]
+    filename = "optimal_guesses.json"
     optimal_guesses = {}
     for solver in solvers:
+        # Always recalculated, so a change to the data or to the scoring is never hidden by the saved file;
+        # the scores themselves are cached on disk under the data digest, so this is cheap when nothing changed
         print(f"Calculating optimal first guess for {solver.get_display_name()}...")
         guess = solver._calculate_optimal_first_guesses()
-        optimal_guesses[solver.get_display_name()] = guess
         print(f"  -> {guess}")
+        optimal_guesses[solver.get_display_name()] = guess
     # Overwrite optimal_guesses.json
-    with open("optimal_guesses.json", "w") as f:
-        json.dump(optimal_guesses, f, indent=2)
+    write_json(filename, optimal_guesses)
     print("\nAll optimal guesses saved to optimal_guesses.json!")
 
 if __name__ == "__main__":
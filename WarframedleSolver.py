@@ -1,15 +1,19 @@
 from GameDleSolver import GameDleSolver
 from typing import List, Tuple
+import pandas as pd
+import numpy as np
 
 class Warframedle(GameDleSolver):
     def __init__(self):
         super().__init__("Warframedle.csv", "Frame")
-        self.preprocess_data()
     
     def preprocess_data(self):
-        """Modify the Release field to only use the first four characters (year)."""
+        """Modify the Release field to only use the first four characters (year), as an integer."""
         if "Release" in self.data.columns:
-            self.data["Release"] = self.data["Release"].astype(str).str[:4]
+            release = self.data["Release"]
+            if not pd.api.types.is_string_dtype(release):
+                release = release.astype(str)
+            self.data["Release"] = release.str.slice(0, 4).astype(np.int16)
     
     def _define_category_types(self):
         # Define which categories can have partial matches